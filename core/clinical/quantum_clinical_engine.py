@@ -332,18 +332,17 @@ class QuantumClinicalEngine:
         as new information becomes available.
         """
         
-        # Simple quantum evolution with numerical stability
-        evolution_operator = np.eye(self.vqbit_dim, dtype=complex)
-        
-        # Add small random perturbations to simulate quantum fluctuations
+        # Simple quantum evolution with numerical stability: the operator is
+        # identity plus small random perturbations simulating quantum fluctuations
         # Use smaller perturbation to avoid numerical instability
         perturbation = 0.001 * (np.random.randn(self.vqbit_dim, self.vqbit_dim) + 
                               1j * np.random.randn(self.vqbit_dim, self.vqbit_dim))
-        evolution_operator += time_step * perturbation
         
         # Apply evolution with numerical stability checks
         try:
-            new_state = evolution_operator @ quantum_case.quantum_state_vector
+            # (I + dt * P) @ psi without materializing the identity matrix
+            state = quantum_case.quantum_state_vector
+            new_state = state + time_step * (perturbation @ state)
             
             # Check for numerical issues
             if np.any(np.isnan(new_state)) or np.any(np.isinf(new_state)):
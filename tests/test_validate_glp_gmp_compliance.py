@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Field of Truth Clinical Trials - Compliance Validator Tests
+
+Unit tests for the AST checks used by validate_glp_gmp_compliance.py: trial
+null-safety guards and data validation pattern matching.
+"""
+
+import ast
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from validate_glp_gmp_compliance import _is_guarded, _is_validation_check
+
+
+def _guarded_accesses(snippet):
+    """Map each `trial.<attr>` access in the snippet to whether it is guarded"""
+    tree = ast.parse(snippet)
+    parents = {child: node for node in ast.walk(tree) for child in ast.iter_child_nodes(node)}
+    return {
+        node.attr: _is_guarded(node, parents)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+        and node.value.id == 'trial'
+    }
+
+
+def _validation_checks(snippet):
+    """Count nodes in the snippet that match the validation patterns"""
+    return sum(_is_validation_check(node) for node in ast.walk(ast.parse(snippet)))
+
+
+class TestTrialNullSafety(unittest.TestCase):
+    """Test which trial attribute accesses count as null-safe"""
+
+    def test_guarded_branches(self):
+        """Accesses on the branch where trial is known to be set are guarded"""
+        cases = {
+            "if trial:\n    trial.a": "a",
+            "if trial is not None:\n    trial.a": "a",
+            "if ready and trial:\n    trial.a": "a",
+            "if not trial:\n    pass\nelse:\n    trial.a": "a",
+            "if trial is None:\n    pass\nelse:\n    trial.a": "a",
+            "x = trial.a if trial else 0": "a",
+            "x = 0 if trial is None else trial.a": "a",
+        }
+        for snippet, attr in cases.items():
+            with self.subTest(snippet=snippet):
+                self.assertTrue(_guarded_accesses(snippet)[attr])
+
+    def test_unguarded_branches(self):
+        """Accesses on the branch where trial may be None are not guarded"""
+        cases = {
+            "x = trial.a": "a",
+            "if trial:\n    pass\nelse:\n    trial.a": "a",
+            "if trial is None:\n    trial.a": "a",
+            "x = trial.a if not trial else 0": "a",
+            "if ready or trial:\n    trial.a": "a",
+            "if trial.a:\n    pass": "a",
+        }
+        for snippet, attr in cases.items():
+            with self.subTest(snippet=snippet):
+                self.assertFalse(_guarded_accesses(snippet)[attr])
+
+
+class TestValidationPatterns(unittest.TestCase):
+    """Test matching of data validation patterns"""
+
+    def test_matching_patterns(self):
+        """None comparisons, len(...) > 0, isinstance() and asserts match"""
+        for snippet in ("x is None", "x is not None", "len(x) > 0",
+                        "isinstance(x, int)", "assert x"):
+            with self.subTest(snippet=snippet):
+                self.assertEqual(_validation_checks(snippet), 1)
+
+    def test_non_matching_patterns(self):
+        """Other comparisons and calls do not match"""
+        for snippet in ("x == None", "len(x) == 0", "len(x) > 5", "len(x) > y",
+                        "print(x)", "x is y"):
+            with self.subTest(snippet=snippet):
+                self.assertEqual(_validation_checks(snippet), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
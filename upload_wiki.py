@@ -5,10 +5,89 @@ Uploads wiki pages to GitHub using the GitHub API
 """
 
 import os
+import sys
 import json
-import requests
+import gzip
 import base64
+import hashlib
+import urllib.request
+import urllib.error
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# requests adds keep-alive pooling and retries; the stdlib client below covers
+# the same JSON calls when it is not installed
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# orjson writes UTF-8 bytes directly; otherwise keep non-ASCII (the pages are
+# full of emoji) unescaped so bodies are not inflated by \uXXXX sequences
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ETag and blob SHA of each page from the last run, for conditional GETs
+ETAG_CACHE_PATH = Path.home() / '.cache' / 'fot_wiki' / 'etags.json'
+
+def git_blob_sha(content):
+    """Git blob SHA-1 of page content, as reported in the page's 'sha' field"""
+    data = content.encode('utf-8')
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+def _json_dumps(obj):
+    """Serialize a JSON request body to compact UTF-8 bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+class _UrllibResponse:
+    """The slice of requests.Response the uploader reads"""
+    
+    def __init__(self, status_code, headers, body):
+        self.status_code = status_code
+        self.headers = headers
+        if headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        self.text = body.decode('utf-8')
+    
+    def json(self):
+        return json.loads(self.text)
+
+class _UrllibSession:
+    """Minimal stand-in for requests.Session built on urllib.request"""
+    
+    def __init__(self):
+        self.headers = {'Accept-Encoding': 'gzip'}
+    
+    def _send(self, method, url, data=None, headers=None):
+        request = urllib.request.Request(
+            url, data=data, method=method, headers={**self.headers, **(headers or {})}
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                return _UrllibResponse(response.status, response.headers, response.read())
+        except urllib.error.HTTPError as e:
+            # 304 and 4xx/5xx still carry a status the caller acts on
+            return _UrllibResponse(e.code, e.headers, e.read())
+    
+    def get(self, url, headers=None):
+        return self._send('GET', url, headers=headers)
+    
+    def post(self, url, data=None, headers=None):
+        return self._send('POST', url, data=data, headers=headers)
+    
+    def put(self, url, data=None, headers=None):
+        return self._send('PUT', url, data=data, headers=headers)
+
+class MissingTokenError(RuntimeError):
+    """Raised when GITHUB_TOKEN is not set"""
 
 class GitHubWikiUploader:
     def __init__(self, repo_owner="FortressAI", repo_name="FoTClinicalTrials"):
@@ -20,17 +99,49 @@ class GitHubWikiUploader:
         # GitHub token - you'll need to set this as an environment variable
         self.token = os.getenv('GITHUB_TOKEN')
         if not self.token:
-            print("❌ Error: GITHUB_TOKEN environment variable not set")
-            print("Please set your GitHub token: export GITHUB_TOKEN=your_token_here")
-            exit(1)
+            raise MissingTokenError("GITHUB_TOKEN environment variable not set")
         
         self.headers = {
             'Authorization': f'token {self.token}',
             'Accept': 'application/vnd.github.v3+json',
             'Content-Type': 'application/json'
         }
+        
+        if REQUESTS_AVAILABLE:
+            # One keep-alive session for every API call; retries back off on
+            # transient gateway errors (urllib3 only retries idempotent methods)
+            self.session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=4,
+                max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+            )
+            self.session.mount('https://', adapter)
+        else:
+            self.session = _UrllibSession()
+        self.session.headers.update(self.headers)
+        
+        self.etags = self._load_etags()
+    
+    @staticmethod
+    def _load_etags():
+        """Load cached page ETags, starting empty if the cache is missing or corrupt"""
+        try:
+            with open(ETAG_CACHE_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
     
-    def upload_wiki_page(self, title, content, commit_message=None):
+    def _save_etags(self):
+        """Persist page ETags for the next run"""
+        try:
+            ETAG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(ETAG_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(self.etags, f, indent=2)
+        except OSError as e:
+            print(f"⚠️  Could not save ETag cache: {str(e)}")
+    
+    def upload_wiki_page(self, title, content, commit_message=None, log=print):
         """Upload a single wiki page to GitHub"""
         if not commit_message:
             commit_message = f"Add {title} wiki page"
@@ -42,39 +153,46 @@ class GitHubWikiUploader:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.wiki_url}/pages",
-                headers=self.headers,
-                json=data
+                data=_json_dumps(data)
             )
             
             if response.status_code == 201:
-                print(f"✅ Successfully uploaded: {title}")
+                log(f"✅ Successfully uploaded: {title}")
                 return True
             else:
-                print(f"❌ Failed to upload {title}: {response.status_code}")
-                print(f"Response: {response.text}")
+                log(f"❌ Failed to upload {title}: {response.status_code}")
+                log(f"Response: {response.text}")
                 return False
                 
         except Exception as e:
-            print(f"❌ Error uploading {title}: {str(e)}")
+            log(f"❌ Error uploading {title}: {str(e)}")
             return False
     
-    def update_wiki_page(self, title, content, commit_message=None):
+    def update_wiki_page(self, title, content, commit_message=None, log=print):
         """Update an existing wiki page"""
         if not commit_message:
             commit_message = f"Update {title} wiki page"
         
-        # First, get the existing page to get the SHA
+        # First, get the existing page to get the SHA; a cached ETag turns an
+        # unchanged page into a bodiless 304
+        cached = self.etags.get(title)
+        conditional = {'If-None-Match': cached['etag']} if cached else {}
         try:
-            response = requests.get(
-                f"{self.wiki_url}/pages/{title}",
-                headers=self.headers
-            )
+            response = self.session.get(f"{self.wiki_url}/pages/{title}", headers=conditional)
             
-            if response.status_code == 200:
-                page_data = response.json()
-                sha = page_data['sha']
+            if response.status_code in (200, 304):
+                if response.status_code == 304:
+                    sha = cached['sha']
+                else:
+                    sha = response.json()['sha']
+                    if 'ETag' in response.headers:
+                        self.etags[title] = {'etag': response.headers['ETag'], 'sha': sha}
+                
+                if sha == git_blob_sha(content):
+                    log(f"✅ Unchanged, skipping: {title}")
+                    return True
                 
                 data = {
                     'title': title,
@@ -83,26 +201,44 @@ class GitHubWikiUploader:
                     'sha': sha
                 }
                 
-                update_response = requests.put(
+                update_response = self.session.put(
                     f"{self.wiki_url}/pages/{title}",
-                    headers=self.headers,
-                    json=data
+                    data=_json_dumps(data)
                 )
                 
                 if update_response.status_code == 200:
-                    print(f"✅ Successfully updated: {title}")
+                    # The page changed, so its old ETag is stale
+                    self.etags.pop(title, None)
+                    log(f"✅ Successfully updated: {title}")
                     return True
                 else:
-                    print(f"❌ Failed to update {title}: {update_response.status_code}")
+                    log(f"❌ Failed to update {title}: {update_response.status_code}")
                     return False
             else:
                 # Page doesn't exist, create it
-                return self.upload_wiki_page(title, content, commit_message)
+                return self.upload_wiki_page(title, content, commit_message, log=log)
                 
         except Exception as e:
-            print(f"❌ Error updating {title}: {str(e)}")
+            log(f"❌ Error updating {title}: {str(e)}")
             return False
     
+    def _upload_one(self, file_path):
+        """Read and upload one wiki file, returning (ok, log lines) for ordered output"""
+        lines = [f"📄 Processing: {file_path.name}"]
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            
+            # Convert filename to title (remove .md extension)
+            title = file_path.name.replace('.md', '')
+            
+            # Upload the page
+            ok = self.update_wiki_page(title, content, log=lines.append)
+        except Exception as e:
+            lines.append(f"❌ Error reading {file_path.name}: {str(e)}")
+            ok = False
+        return ok, lines
+    
     def upload_all_wiki_pages(self, wiki_dir="wiki"):
         """Upload all wiki pages from the wiki directory"""
         wiki_path = Path(wiki_dir)
@@ -112,7 +248,6 @@ class GitHubWikiUploader:
             return False
         
         success_count = 0
-        total_count = 0
         
         # Define the order of pages to upload
         page_order = [
@@ -129,43 +264,52 @@ class GitHubWikiUploader:
         print(f"🔗 Repository: {self.repo_owner}/{self.repo_name}")
         print()
         
+        # One directory listing instead of a stat per page, sorted into page order
+        order_idx = {name: i for i, name in enumerate(page_order)}
+        with os.scandir(wiki_path) as it:
+            file_paths = [entry for entry in it if entry.name in order_idx and entry.is_file()]
+        file_paths.sort(key=lambda entry: order_idx[entry.name])
+        
+        found = {entry.name for entry in file_paths}
         for filename in page_order:
-            file_path = wiki_path / filename
-            
-            if file_path.exists():
-                total_count += 1
-                print(f"📄 Processing: {filename}")
-                
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Convert filename to title (remove .md extension)
-                    title = filename.replace('.md', '')
-                    
-                    # Upload the page
-                    if self.update_wiki_page(title, content):
-                        success_count += 1
-                    
-                    print()  # Add spacing between pages
-                    
-                except Exception as e:
-                    print(f"❌ Error reading {filename}: {str(e)}")
-                    print()
-            else:
+            if filename not in found:
                 print(f"⚠️  File not found: {filename}")
                 print()
+        total_count = len(file_paths)
+        
+        # Pages are independent and the uploads wait on the network, so run
+        # them concurrently and print each page's log in page order afterwards
+        if file_paths:
+            with ThreadPoolExecutor(max_workers=min(4, total_count)) as executor:
+                results = list(executor.map(self._upload_one, file_paths))
+        else:
+            results = []
+        
+        self._save_etags()
         
-        print("=" * 50)
-        print(f"📊 Upload Summary:")
-        print(f"✅ Successful: {success_count}/{total_count}")
-        print(f"❌ Failed: {total_count - success_count}/{total_count}")
+        # Page logs and the summary are collected and written in one call
+        out = []
+        for ok, lines in results:
+            out.extend(lines)
+            out.append("")  # Add spacing between pages
+            if ok:
+                success_count += 1
+        
+        out += [
+            "=" * 50,
+            "📊 Upload Summary:",
+            f"✅ Successful: {success_count}/{total_count}",
+            f"❌ Failed: {total_count - success_count}/{total_count}",
+        ]
         
         if success_count == total_count:
-            print("🎉 All wiki pages uploaded successfully!")
-            print(f"🔗 View your wiki at: https://github.com/{self.repo_owner}/{self.repo_name}/wiki")
+            out.append("🎉 All wiki pages uploaded successfully!")
+            out.append(f"🔗 View your wiki at: https://github.com/{self.repo_owner}/{self.repo_name}/wiki")
         else:
-            print("⚠️  Some pages failed to upload. Check the errors above.")
+            out.append("⚠️  Some pages failed to upload. Check the errors above.")
+        
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
         
         return success_count == total_count
 
@@ -181,7 +325,12 @@ def main():
         return
     
     # Initialize uploader
-    uploader = GitHubWikiUploader()
+    try:
+        uploader = GitHubWikiUploader()
+    except MissingTokenError as e:
+        print(f"❌ Error: {e}")
+        print("Please set your GitHub token: export GITHUB_TOKEN=your_token_here")
+        sys.exit(1)
     
     # Upload all wiki pages
     success = uploader.upload_all_wiki_pages()
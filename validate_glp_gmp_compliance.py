@@ -8,9 +8,115 @@ for null safety, error handling, and data integrity.
 """
 
 import ast
-import re
 import sys
 import os
+import pickle
+import tempfile
+from pathlib import Path
+
+# Git-ignored cache directory at the repository root, independent of the
+# working directory; parsed trees are keyed by file stat and Python version
+GLP_CACHE_DIR = Path(__file__).resolve().parent / '.glp_cache'
+
+def _parse_cached(path, source):
+    """Parse source, reusing the pickled AST while the file is unchanged"""
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size, sys.version_info[:2])
+    cache_path = GLP_CACHE_DIR / f"{Path(path).stem}.ast.pkl"
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == key \
+                and isinstance(cached[1], ast.Module):
+            return cached[1]
+    except Exception:
+        # The cache is best effort: a missing or damaged pickle can raise
+        # almost anything, and must never fail the gate. Parse below.
+        pass
+    
+    tree = ast.parse(source)
+    tmp_path = None
+    try:
+        GLP_CACHE_DIR.mkdir(exist_ok=True)
+        # Write to a temp file and swap it in, so an interrupted or concurrent
+        # run never leaves a half-written cache behind
+        with tempfile.NamedTemporaryFile('wb', dir=GLP_CACHE_DIR, suffix='.tmp',
+                                         delete=False) as f:
+            tmp_path = f.name
+            pickle.dump((key, tree), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+    except Exception:
+        pass  # Caching is best effort
+    finally:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    return tree
+
+def _is_trial(node):
+    return isinstance(node, ast.Name) and node.id == 'trial'
+
+def _is_none_compare(test, op_type):
+    """Match `trial is None` (ast.Is) or `trial is not None` (ast.IsNot)"""
+    return (isinstance(test, ast.Compare) and _is_trial(test.left)
+            and len(test.ops) == 1 and isinstance(test.ops[0], op_type)
+            and isinstance(test.comparators[0], ast.Constant)
+            and test.comparators[0].value is None)
+
+def _proves_present(test):
+    """True if the test passing implies trial is not None"""
+    if _is_trial(test) or _is_none_compare(test, ast.IsNot):
+        return True
+    return (isinstance(test, ast.BoolOp) and isinstance(test.op, ast.And)
+            and any(_proves_present(value) for value in test.values))
+
+def _proves_absent(test):
+    """True if the test failing implies trial is not None"""
+    if isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not) and _is_trial(test.operand):
+        return True
+    if _is_none_compare(test, ast.Is):
+        return True
+    return (isinstance(test, ast.BoolOp) and isinstance(test.op, ast.Or)
+            and any(_proves_absent(value) for value in test.values))
+
+def _is_guarded(node, parents):
+    """Check whether a node only runs on a branch where `trial` is not None
+    
+    The body of an if/conditional expression is guarded by `trial`,
+    `trial is not None` or an `and` chain containing one; the else branch by
+    `not trial`, `trial is None` or an `or` chain containing one.
+    """
+    child, parent = node, parents.get(node)
+    while parent is not None:
+        if isinstance(parent, (ast.If, ast.IfExp)):
+            body = parent.body if isinstance(parent.body, list) else [parent.body]
+            orelse = parent.orelse if isinstance(parent.orelse, list) else [parent.orelse]
+            if any(child is n for n in body) and _proves_present(parent.test):
+                return True
+            if any(child is n for n in orelse) and _proves_absent(parent.test):
+                return True
+        child, parent = parent, parents.get(parent)
+    return False
+
+def _is_validation_check(node):
+    """Match None comparisons, len(...) > 0, isinstance() calls and asserts"""
+    if isinstance(node, ast.Assert):
+        return True
+    if isinstance(node, ast.Call):
+        return isinstance(node.func, ast.Name) and node.func.id == 'isinstance'
+    if isinstance(node, ast.Compare):
+        if any(isinstance(c, ast.Constant) and c.value is None for c in node.comparators) \
+                and any(isinstance(op, (ast.Is, ast.IsNot)) for op in node.ops):
+            return True
+        left, right = node.left, node.comparators[0]
+        return (isinstance(left, ast.Call) and isinstance(left.func, ast.Name)
+                and left.func.id == 'len' and isinstance(node.ops[0], ast.Gt)
+                and isinstance(right, ast.Constant) and type(right.value) is int
+                and right.value == 0)
+    return False
 
 def validate_glp_gmp_compliance():
     """Validate GLP/GMP compliance requirements"""
@@ -25,7 +131,7 @@ def validate_glp_gmp_compliance():
     # 1. Syntax Validation
     print("\n1. ✅ Syntax Validation")
     try:
-        ast.parse(source)
+        tree = _parse_cached('clinical_app.py', source)
         print("   ✅ No syntax errors found")
     except SyntaxError as e:
         print(f"   ❌ Syntax error: {e}")
@@ -37,27 +143,41 @@ def validate_glp_gmp_compliance():
     # 2. Null Safety Validation
     print("\n2. ✅ Null Safety Validation")
     
-    # Find all trial attribute accesses
-    trial_accesses = re.findall(r'trial\.[a-zA-Z_]+', source)
+    # One pass over the tree builds the parent map and collects everything the
+    # later checks need, instead of a regex sweep per pattern
+    parents = {}
+    trial_accesses = []
+    try_blocks = except_blocks = 0
+    session_state_usage = 0
+    validation_count = 0
+    for node in ast.walk(tree):
+        for child in ast.iter_child_nodes(node):
+            parents[child] = node
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            if node.value.id == 'trial':
+                trial_accesses.append(node)
+            elif node.value.id == 'st' and node.attr == 'session_state':
+                session_state_usage += 1
+        elif isinstance(node, ast.Try):
+            try_blocks += 1
+        elif isinstance(node, ast.ExceptHandler):
+            except_blocks += 1
+        if _is_validation_check(node):
+            validation_count += 1
+    
+    # Check if accesses are protected by an enclosing null check; the source is
+    # only split into lines if there is an offending line to print
+    lines = None
     protected_accesses = 0
     unprotected_accesses = 0
-    
-    # Check if accesses are protected by null checks
-    lines = source.split('\n')
-    for i, line in enumerate(lines):
-        if 'trial.' in line:
-            # Check if there's a null check before this line
-            protected = False
-            for j in range(max(0, i-10), i):
-                if 'if trial:' in lines[j] or 'if trial is not None:' in lines[j]:
-                    protected = True
-                    break
-            
-            if protected:
-                protected_accesses += 1
-            else:
-                unprotected_accesses += 1
-                print(f"   ⚠️  Line {i+1}: {line.strip()}")
+    for node in trial_accesses:
+        if _is_guarded(node, parents):
+            protected_accesses += 1
+        else:
+            unprotected_accesses += 1
+            if lines is None:
+                lines = source.split('\n')
+            print(f"   ⚠️  Line {node.lineno}: {lines[node.lineno - 1].strip()}")
     
     if unprotected_accesses == 0:
         print("   ✅ All trial accesses are null-safe")
@@ -68,10 +188,6 @@ def validate_glp_gmp_compliance():
     # 3. Error Handling Validation
     print("\n3. ✅ Error Handling Validation")
     
-    # Check for try-except blocks
-    try_blocks = len(re.findall(r'try:', source))
-    except_blocks = len(re.findall(r'except', source))
-    
     if try_blocks > 0 and except_blocks > 0:
         print(f"   ✅ Found {try_blocks} try-except blocks for error handling")
     else:
@@ -81,23 +197,10 @@ def validate_glp_gmp_compliance():
     print("\n4. ✅ Data Integrity Validation")
     
     # Check for session state usage
-    session_state_usage = len(re.findall(r'st\.session_state', source))
     if session_state_usage > 0:
         print(f"   ✅ Found {session_state_usage} session state usages for data persistence")
     
     # Check for data validation
-    validation_patterns = [
-        r'if.*is not None',
-        r'if.*is None',
-        r'len\(.*\) > 0',
-        r'isinstance\(',
-        r'assert '
-    ]
-    
-    validation_count = 0
-    for pattern in validation_patterns:
-        validation_count += len(re.findall(pattern, source))
-    
     print(f"   ✅ Found {validation_count} data validation patterns")
     
     # 5. Regulatory Compliance Validation
@@ -8,24 +8,52 @@ import os
 import json
 import requests
 import time
+import functools
 from pathlib import Path
 
+@functools.lru_cache(maxsize=32)
+def _format_wiki_page(title, content):
+    """Wrap page content in the wiki header and footer (memoized per title/content)"""
+    return f"""# {title}
+
+{content}
+
+---
+**🏥⚛️ Field of Truth Clinical Trials - {title}**
+**🔒 FDA Compliant | 🛡️ EMA Ready | ⚛️ Quantum Enhanced**"""
+
 class GitHubWikiUploader:
+    wiki_files = [
+        ('Home', 'wiki/Home.md'),
+        ('Quick-Start-Guide', 'wiki/Quick-Start-Guide.md'),
+        ('Quantum-Substrate', 'wiki/Quantum-Substrate.md'),
+        ('Field-of-Truth-Claims', 'wiki/Field-of-Truth-Claims.md'),
+        ('FDA-Compliance', 'wiki/FDA-Compliance.md'),
+        ('FAQ', 'wiki/FAQ.md')
+    ]
+    
     def __init__(self):
         self.repo_owner = "FortressAI"
         self.repo_name = "FoTClinicalTrials"
         self.base_url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}"
         self.wiki_url = f"{self.base_url}/wiki"
+        # path -> (mtime, content), so each wiki file is read once per change
+        self._content_cache = {}
+    
+    def _load(self, path):
+        """Read a wiki file, reusing the cached content while its mtime is unchanged"""
+        mtime = os.path.getmtime(path)
+        cached = self._content_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self._content_cache[path] = (mtime, content)
+        return content
         
     def create_wiki_page_content(self, title, content):
         """Create properly formatted wiki page content"""
-        return f"""# {title}
-
-{content}
-
----
-**🏥⚛️ Field of Truth Clinical Trials - {title}**
-**🔒 FDA Compliant | 🛡️ EMA Ready | ⚛️ Quantum Enhanced**"""
+        return _format_wiki_page(title, content)
     
     def upload_via_web_interface(self, title, content):
         """Upload wiki page via web interface simulation"""
@@ -33,20 +61,38 @@ class GitHubWikiUploader:
         
         # Create a formatted version for web upload
         formatted_content = self.create_wiki_page_content(title, content)
+        char_len = len(formatted_content)
+        line_count = formatted_content.count('\n') + 1
         
-        # Save to a temporary file for easy copy-paste
+        # Save to a temporary file for easy copy-paste, unless an identical copy
+        # is already on disk
         temp_file = f"temp_{title.replace('-', '_').lower()}.md"
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            f.write(formatted_content)
+        if not self._matches_file(temp_file, formatted_content.encode('utf-8')):
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(formatted_content)
+            print(f"✅ {title} content saved to {temp_file}")
+        else:
+            print(f"✅ {title} content unchanged in {temp_file}")
         
-        print(f"✅ {title} content saved to {temp_file}")
-        print(f"📋 Content length: {len(formatted_content):,} characters")
-        print(f"📊 Lines: {len(formatted_content.split(chr(10))):,}")
+        print(f"📋 Content length: {char_len:,} characters")
+        print(f"📊 Lines: {line_count:,}")
         
         return temp_file
     
-    def create_upload_instructions(self):
-        """Create detailed upload instructions"""
+    @staticmethod
+    def _matches_file(path, data):
+        """Check whether a file already holds exactly these bytes"""
+        if not os.path.exists(path) or os.path.getsize(path) != len(data):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == data
+    
+    def create_upload_instructions(self, processed_files=None):
+        """Create detailed upload instructions
+        
+        processed_files is the (title, temp_file) list from
+        process_all_wiki_files; without it the wiki files are prepared here.
+        """
         instructions = f"""
 # 🚀 GitHub Wiki Upload Instructions
 
@@ -65,23 +111,15 @@ Upload the following pages in order:
 
 """
         
-        wiki_files = [
-            ('Home', 'wiki/Home.md'),
-            ('Quick-Start-Guide', 'wiki/Quick-Start-Guide.md'),
-            ('Quantum-Substrate', 'wiki/Quantum-Substrate.md'),
-            ('Field-of-Truth-Claims', 'wiki/Field-of-Truth-Claims.md'),
-            ('FDA-Compliance', 'wiki/FDA-Compliance.md'),
-            ('FAQ', 'wiki/FAQ.md')
-        ]
+        if processed_files is None:
+            processed_files = [
+                (title, self.upload_via_web_interface(title, self._load(filename)))
+                for title, filename in self.wiki_files
+                if os.path.exists(filename)
+            ]
         
-        for i, (title, filename) in enumerate(wiki_files, 1):
-            if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                temp_file = self.upload_via_web_interface(title, content)
-                
-                instructions += f"""
+        for i, (title, temp_file) in enumerate(processed_files, 1):
+            instructions += f"""
 #### {i}. {title}
 1. **Page Title**: `{title}`
 2. **Content**: Copy from `{temp_file}`
@@ -120,14 +158,7 @@ https://github.com/{self.repo_owner}/{self.repo_name}/wiki
         print("🏥⚛️ Field of Truth Clinical Trials - Wiki Upload Processor")
         print("=" * 60)
         
-        wiki_files = [
-            ('Home', 'wiki/Home.md'),
-            ('Quick-Start-Guide', 'wiki/Quick-Start-Guide.md'),
-            ('Quantum-Substrate', 'wiki/Quantum-Substrate.md'),
-            ('Field-of-Truth-Claims', 'wiki/Field-of-Truth-Claims.md'),
-            ('FDA-Compliance', 'wiki/FDA-Compliance.md'),
-            ('FAQ', 'wiki/FAQ.md')
-        ]
+        wiki_files = self.wiki_files
         
         print(f"🔗 Repository: {self.repo_owner}/{self.repo_name}")
         print(f"📁 Processing {len(wiki_files)} wiki files...")
@@ -139,8 +170,7 @@ https://github.com/{self.repo_owner}/{self.repo_name}/wiki
             if os.path.exists(filename):
                 print(f"📄 Processing: {title}")
                 
-                with open(filename, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self._load(filename)
                 
                 temp_file = self.upload_via_web_interface(title, content)
                 processed_files.append((title, temp_file))
@@ -152,7 +182,7 @@ https://github.com/{self.repo_owner}/{self.repo_name}/wiki
                 print()
         
         # Create comprehensive upload instructions
-        instructions = self.create_upload_instructions()
+        instructions = self.create_upload_instructions(processed_files)
         
         with open('WIKI_UPLOAD_INSTRUCTIONS.md', 'w', encoding='utf-8') as f:
             f.write(instructions)